@@ -27,3 +27,14 @@ def validate_instruction_type(parsed_data: Any, expected_type: IntEnum) -> None:
         raise ValueError(
             f"invalid instruction; instruction index mismatch {parsed_data.instruction_type} != {expected_type}"
         )
+
+
+def validate_instruction_data_type(data: bytes, expected_type: IntEnum) -> None:
+    """Check that the 1-byte instruction type tag leading the raw data matches the expected instruction type.
+
+    :param data: Raw instruction data, starting with the instruction type tag.
+    :param expected_type: The expected instruction type.
+    """
+    instruction_type = data[0] if data else None
+    if instruction_type != expected_type:
+        raise ValueError(f"invalid instruction; instruction index mismatch {instruction_type} != {expected_type}")
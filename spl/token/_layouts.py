@@ -1,5 +1,7 @@
 """Token instruction layouts."""
 from enum import IntEnum
+from struct import Struct
+from typing import Any, Dict
 
 from construct import Int8ul, Int32ul, Int64ul, Pass  # type: ignore
 from construct import Struct as cStruct
@@ -46,32 +48,37 @@ _SET_AUTHORITY_LAYOUT = cStruct(
 
 _AMOUNT2_LAYOUT = cStruct("amount" / Int64ul, "decimals" / Int8ul)
 
+INSTRUCTION_ARGS_LAYOUTS: Dict[InstructionType, Any] = {
+    InstructionType.INITIALIZE_MINT: _INITIALIZE_MINT_LAYOUT,
+    InstructionType.INITIALIZE_ACCOUNT: Pass,
+    InstructionType.INITIALIZE_MULTISIG: _INITIALIZE_MULTISIG_LAYOUT,
+    InstructionType.TRANSFER: _AMOUNT_LAYOUT,
+    InstructionType.APPROVE: _AMOUNT_LAYOUT,
+    InstructionType.REVOKE: Pass,
+    InstructionType.SET_AUTHORITY: _SET_AUTHORITY_LAYOUT,
+    InstructionType.MINT_TO: _AMOUNT_LAYOUT,
+    InstructionType.BURN: _AMOUNT_LAYOUT,
+    InstructionType.CLOSE_ACCOUNT: Pass,
+    InstructionType.FREEZE_ACCOUNT: Pass,
+    InstructionType.THAW_ACCOUNT: Pass,
+    InstructionType.TRANSFER2: _AMOUNT2_LAYOUT,
+    InstructionType.APPROVE2: _AMOUNT2_LAYOUT,
+    InstructionType.MINT_TO2: _AMOUNT2_LAYOUT,
+    InstructionType.BURN2: _AMOUNT2_LAYOUT,
+}
+"""Args layout of each instruction type, for (de)serializing the data that follows the 1-byte type tag."""
+
 INSTRUCTIONS_LAYOUT = cStruct(
     "instruction_type" / Int8ul,
-    "args"
-    / Switch(
-        lambda this: this.instruction_type,
-        {
-            InstructionType.INITIALIZE_MINT: _INITIALIZE_MINT_LAYOUT,
-            InstructionType.INITIALIZE_ACCOUNT: Pass,
-            InstructionType.INITIALIZE_MULTISIG: _INITIALIZE_MULTISIG_LAYOUT,
-            InstructionType.TRANSFER: _AMOUNT_LAYOUT,
-            InstructionType.APPROVE: _AMOUNT_LAYOUT,
-            InstructionType.REVOKE: Pass,
-            InstructionType.SET_AUTHORITY: _SET_AUTHORITY_LAYOUT,
-            InstructionType.MINT_TO: _AMOUNT_LAYOUT,
-            InstructionType.BURN: _AMOUNT_LAYOUT,
-            InstructionType.CLOSE_ACCOUNT: Pass,
-            InstructionType.FREEZE_ACCOUNT: Pass,
-            InstructionType.THAW_ACCOUNT: Pass,
-            InstructionType.TRANSFER2: _AMOUNT2_LAYOUT,
-            InstructionType.APPROVE2: _AMOUNT2_LAYOUT,
-            InstructionType.MINT_TO2: _AMOUNT2_LAYOUT,
-            InstructionType.BURN2: _AMOUNT2_LAYOUT,
-        },
-    ),
+    "args" / Switch(lambda this: this.instruction_type, INSTRUCTION_ARGS_LAYOUTS),
 )
 
+AMOUNT_INSTRUCTION_LAYOUT = Struct("<BQ")
+"""Instruction type tag followed by a u64 amount, packed with `struct` instead of construct."""
+
+AMOUNT2_INSTRUCTION_LAYOUT = Struct("<BQB")
+"""Instruction type tag followed by a u64 amount and u8 decimals, packed with `struct` instead of construct."""
+
 MINT_LAYOUT = cStruct(
     "mint_authority_option" / Int32ul,
     "mint_authority" / PUBLIC_KEY_LAYOUT,
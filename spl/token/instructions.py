@@ -1,13 +1,46 @@
 """SPL token instructions."""
 
+from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Any, List, NamedTuple, Optional, Union
+from struct import Struct
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from solana.publickey import PublicKey
 from solana.sysvar import SYSVAR_RENT_PUBKEY
 from solana.transaction import AccountMeta, TransactionInstruction
-from solana.utils.validate import validate_instruction_keys, validate_instruction_type
-from spl.token._layouts import INSTRUCTIONS_LAYOUT, InstructionType  # type: ignore
+from solana.utils.validate import validate_instruction_data_type, validate_instruction_keys
+from spl.token._layouts import (  # type: ignore
+    AMOUNT2_INSTRUCTION_LAYOUT,
+    AMOUNT_INSTRUCTION_LAYOUT,
+    INSTRUCTION_ARGS_LAYOUTS,
+    INSTRUCTIONS_LAYOUT,
+    InstructionType,
+)
+
+# Plain int tags for the `struct`-packed instructions; packing an IntEnum member is about twice as slow.
+_TRANSFER_TAG = InstructionType.TRANSFER.value
+_APPROVE_TAG = InstructionType.APPROVE.value
+_MINT_TO_TAG = InstructionType.MINT_TO.value
+_BURN_TAG = InstructionType.BURN.value
+_TRANSFER2_TAG = InstructionType.TRANSFER2.value
+_APPROVE2_TAG = InstructionType.APPROVE2.value
+_MINT_TO2_TAG = InstructionType.MINT_TO2.value
+_BURN2_TAG = InstructionType.BURN2.value
+
+_ZERO_PUBKEY_BYTES = bytes(PublicKey.LENGTH)
+"""Encoded `PublicKey(0)`, used as the placeholder for an absent optional authority."""
+
+_ZERO_ARG_DATA: Dict[InstructionType, bytes] = {
+    instruction_type: INSTRUCTIONS_LAYOUT.build(dict(instruction_type=instruction_type, args=None))
+    for instruction_type in (
+        InstructionType.INITIALIZE_ACCOUNT,
+        InstructionType.REVOKE,
+        InstructionType.CLOSE_ACCOUNT,
+        InstructionType.FREEZE_ACCOUNT,
+        InstructionType.THAW_ACCOUNT,
+    )
+}
+"""Prebuilt data of the instructions without args, which serialize to the same bytes every time."""
 
 
 class AuthorityType(IntEnum):
@@ -23,8 +56,13 @@ class AuthorityType(IntEnum):
     """Authority to close a token account."""
 
 
+_AUTHORITY_TYPES: Dict[int, AuthorityType] = {authority.value: authority for authority in AuthorityType}
+"""AuthorityType members by their encoded u8 value, for decoding SetAuthority instructions."""
+
+
 # Instruction Params
-class InitializeMintParams(NamedTuple):
+@dataclass
+class InitializeMintParams:
     """Initialize token mint transaction params."""
 
     decimals: int
@@ -39,7 +77,8 @@ class InitializeMintParams(NamedTuple):
     """The freeze authority/multisignature of the mint."""
 
 
-class InitializeAccountParams(NamedTuple):
+@dataclass
+class InitializeAccountParams:
     """Initialize token account transaction params."""
 
     program_id: PublicKey
@@ -52,7 +91,8 @@ class InitializeAccountParams(NamedTuple):
     """Owner of the new account."""
 
 
-class InitializeMultisigParams(NamedTuple):
+@dataclass
+class InitializeMultisigParams:
     """Initialize multisig token account transaction params."""
 
     program_id: PublicKey
@@ -61,11 +101,12 @@ class InitializeMultisigParams(NamedTuple):
     """New multisig account address."""
     m: int
     """The number of signers (M) required to validate this multisignature account."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Addresses of multisig signers."""
 
 
-class TransferParams(NamedTuple):
+@dataclass
+class TransferParams:
     """Transfer token transaction params."""
 
     program_id: PublicKey
@@ -78,11 +119,12 @@ class TransferParams(NamedTuple):
     """Owner of the source account."""
     amount: int
     """Number of tokens to transfer."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig."""
 
 
-class ApproveParams(NamedTuple):
+@dataclass
+class ApproveParams:
     """Approve token transaction params."""
 
     program_id: PublicKey
@@ -95,11 +137,12 @@ class ApproveParams(NamedTuple):
     """Owner of the source account."""
     amount: int
     """Maximum number of tokens the delegate may transfer."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig."""
 
 
-class RevokeParams(NamedTuple):
+@dataclass
+class RevokeParams:
     """Revoke token transaction params."""
 
     program_id: PublicKey
@@ -108,11 +151,12 @@ class RevokeParams(NamedTuple):
     """Delegate account authorized to perform a transfer of tokens from the source account."""
     owner: PublicKey
     """Owner of the source account."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig."""
 
 
-class SetAuthorityParams(NamedTuple):
+@dataclass
+class SetAuthorityParams:
     """Set token authority transaction params."""
 
     program_id: PublicKey
@@ -123,13 +167,14 @@ class SetAuthorityParams(NamedTuple):
     """The type of authority to update."""
     current_authority: PublicKey
     """Current authority of the specified type."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `current_authority` is a multiSig."""
     new_authority: Optional[PublicKey] = None
     """New authority of the account."""
 
 
-class MintToParams(NamedTuple):
+@dataclass
+class MintToParams:
     """Mint token transaction params."""
 
     program_id: PublicKey
@@ -142,11 +187,12 @@ class MintToParams(NamedTuple):
     """The mint authority."""
     amount: int
     """Amount to mint."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `mint_authority` is a multiSig."""
 
 
-class BurnParams(NamedTuple):
+@dataclass
+class BurnParams:
     """Burn token transaction params."""
 
     program_id: PublicKey
@@ -159,11 +205,12 @@ class BurnParams(NamedTuple):
     """Owner of the account."""
     amount: int
     """Amount to burn."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig"""
 
 
-class CloseAccountParams(NamedTuple):
+@dataclass
+class CloseAccountParams:
     """Close token account transaction params."""
 
     program_id: PublicKey
@@ -174,11 +221,12 @@ class CloseAccountParams(NamedTuple):
     """Address of account to receive the remaining balance of the closed account."""
     owner: PublicKey
     """Owner of the account."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig"""
 
 
-class FreezeAccountParams(NamedTuple):
+@dataclass
+class FreezeAccountParams:
     """Freeze token account transaction params."""
 
     program_id: PublicKey
@@ -189,11 +237,12 @@ class FreezeAccountParams(NamedTuple):
     """Public key of the minter account."""
     owner: PublicKey
     """Owner of the account."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig"""
 
 
-class ThawAccountParams(NamedTuple):
+@dataclass
+class ThawAccountParams:
     """Thaw token account transaction params."""
 
     program_id: PublicKey
@@ -204,11 +253,12 @@ class ThawAccountParams(NamedTuple):
     """Public key of the minter account."""
     owner: PublicKey
     """Owner of the account."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig"""
 
 
-class Transfer2Params(NamedTuple):
+@dataclass
+class Transfer2Params:
     """Transfer2 token transaction params."""
 
     program_id: PublicKey
@@ -225,11 +275,12 @@ class Transfer2Params(NamedTuple):
     """Number of tokens to transfer."""
     decimals: int
     """Amount decimals."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig."""
 
 
-class Approve2Params(NamedTuple):
+@dataclass
+class Approve2Params:
     """Approve2 token transaction params."""
 
     program_id: PublicKey
@@ -246,11 +297,12 @@ class Approve2Params(NamedTuple):
     """Maximum number of tokens the delegate may transfer."""
     decimals: int
     """Amount decimals."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig."""
 
 
-class MintTo2Params(NamedTuple):
+@dataclass
+class MintTo2Params:
     """MintTo2 token transaction params."""
 
     program_id: PublicKey
@@ -265,11 +317,12 @@ class MintTo2Params(NamedTuple):
     """Amount to mint."""
     decimals: int
     """Amount decimals."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `mint_authority` is a multiSig."""
 
 
-class Burn2Params(NamedTuple):
+@dataclass
+class Burn2Params:
     """Burn2 token transaction params."""
 
     program_id: PublicKey
@@ -284,7 +337,7 @@ class Burn2Params(NamedTuple):
     """Amount to burn."""
     decimals: int
     """Amount decimals."""
-    signers: List[PublicKey] = []
+    signers: List[PublicKey] = field(default_factory=list)
     """Signing accounts if `owner` is a multiSig"""
 
 
@@ -292,234 +345,309 @@ def __parse_and_validate_instruction(
     instruction: TransactionInstruction,
     expected_keys: int,
     expected_type: InstructionType,
-) -> Any:  # Returns a Construct container.
+) -> Any:  # Returns the Construct container of the instruction args.
+    validate_instruction_keys(instruction, expected_keys)
+    validate_instruction_data_type(instruction.data, expected_type)
+    return INSTRUCTION_ARGS_LAYOUTS[expected_type].parse(instruction.data[1:])
+
+
+def __unpack_and_validate_instruction(
+    instruction: TransactionInstruction,
+    expected_keys: int,
+    expected_type: InstructionType,
+    layout: Struct,
+) -> Tuple[Any, ...]:  # Returns the unpacked args, without the instruction type.
     validate_instruction_keys(instruction, expected_keys)
-    data = INSTRUCTIONS_LAYOUT.parse(instruction.data)
-    validate_instruction_type(data, expected_type)
-    return data
+    validate_instruction_data_type(instruction.data, expected_type)
+    return layout.unpack_from(instruction.data)[1:]
 
 
 def decode_initialize_mint(instruction: TransactionInstruction) -> InitializeMintParams:
     """Decode an initialize mint token instruction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MINT)
+    args = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MINT)
+    keys = instruction.keys
     return InitializeMintParams(
-        decimals=parsed_data.args.decimals,
+        decimals=args.decimals,
         program_id=instruction.program_id,
-        mint=instruction.keys[0].pubkey,
-        mint_authority=PublicKey(parsed_data.args.mint_authority),
-        freeze_authority=PublicKey(parsed_data.args.freeze_authority)
-        if parsed_data.args.freeze_authority_option
-        else None,
+        mint=keys[0].pubkey,
+        mint_authority=PublicKey(args.mint_authority),
+        freeze_authority=PublicKey(args.freeze_authority) if args.freeze_authority_option else None,
     )
 
 
 def decode_initialize_account(instruction: TransactionInstruction) -> InitializeAccountParams:
     """Decode an initialize account token instruction and retrieve the instruction params."""
     _ = __parse_and_validate_instruction(instruction, 4, InstructionType.INITIALIZE_ACCOUNT)
+    keys = instruction.keys
     return InitializeAccountParams(
         program_id=instruction.program_id,
-        account=instruction.keys[0].pubkey,
-        mint=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
+        account=keys[0].pubkey,
+        mint=keys[1].pubkey,
+        owner=keys[2].pubkey,
     )
 
 
 def decode_initialize_multisig(instruction: TransactionInstruction) -> InitializeMultisigParams:
     """Decode an initialize multisig account token instruction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MULTISIG)
-    num_signers = parsed_data.args.m
+    args = __parse_and_validate_instruction(instruction, 2, InstructionType.INITIALIZE_MULTISIG)
+    keys = instruction.keys
+    num_signers = args.m
     validate_instruction_keys(instruction, 2 + num_signers)
     return InitializeMultisigParams(
         program_id=instruction.program_id,
-        multisig=instruction.keys[0].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[-num_signers:]],
+        multisig=keys[0].pubkey,
+        signers=[signer.pubkey for signer in keys[2:]],
         m=num_signers,
     )
 
 
 def decode_transfer(instruction: TransactionInstruction) -> TransferParams:
     """Decode a transfer token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.TRANSFER)
+    (amount,) = __unpack_and_validate_instruction(instruction, 3, InstructionType.TRANSFER, AMOUNT_INSTRUCTION_LAYOUT)
+    keys = instruction.keys
     return TransferParams(
         program_id=instruction.program_id,
-        source=instruction.keys[0].pubkey,
-        dest=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
-        amount=parsed_data.args.amount,
+        source=keys[0].pubkey,
+        dest=keys[1].pubkey,
+        owner=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
+        amount=amount,
     )
 
 
 def decode_approve(instruction: TransactionInstruction) -> ApproveParams:
     """Decode a approve token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.APPROVE)
+    (amount,) = __unpack_and_validate_instruction(instruction, 3, InstructionType.APPROVE, AMOUNT_INSTRUCTION_LAYOUT)
+    keys = instruction.keys
     return ApproveParams(
         program_id=instruction.program_id,
-        source=instruction.keys[0].pubkey,
-        delegate=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
-        amount=parsed_data.args.amount,
+        source=keys[0].pubkey,
+        delegate=keys[1].pubkey,
+        owner=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
+        amount=amount,
     )
 
 
 def decode_revoke(instruction: TransactionInstruction) -> RevokeParams:
     """Decode a revoke token transaction and retrieve the instruction params."""
     _ = __parse_and_validate_instruction(instruction, 2, InstructionType.REVOKE)
+    keys = instruction.keys
     return RevokeParams(
         program_id=instruction.program_id,
-        delegate=instruction.keys[0].pubkey,
-        owner=instruction.keys[1].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[2:]],
+        delegate=keys[0].pubkey,
+        owner=keys[1].pubkey,
+        signers=[signer.pubkey for signer in keys[2:]],
     )
 
 
 def decode_set_authority(instruction: TransactionInstruction) -> SetAuthorityParams:
     """Decode a set authority token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 2, InstructionType.SET_AUTHORITY)
+    args = __parse_and_validate_instruction(instruction, 2, InstructionType.SET_AUTHORITY)
+    authority = _AUTHORITY_TYPES.get(args.authority_type)
+    if authority is None:
+        raise ValueError(f"invalid instruction; unknown authority type {args.authority_type}")
+    keys = instruction.keys
     return SetAuthorityParams(
         program_id=instruction.program_id,
-        account=instruction.keys[0].pubkey,
-        authority=AuthorityType(parsed_data.args.authority_type),
-        new_authority=PublicKey(parsed_data.args.new_authority) if parsed_data.args.new_authority_option else None,
-        current_authority=instruction.keys[1].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[2:]],
+        account=keys[0].pubkey,
+        authority=authority,
+        new_authority=PublicKey(args.new_authority) if args.new_authority_option else None,
+        current_authority=keys[1].pubkey,
+        signers=[signer.pubkey for signer in keys[2:]],
     )
 
 
 def decode_mint_to(instruction: TransactionInstruction) -> MintToParams:
     """Decode a mint to token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO)
+    (amount,) = __unpack_and_validate_instruction(instruction, 3, InstructionType.MINT_TO, AMOUNT_INSTRUCTION_LAYOUT)
+    keys = instruction.keys
     return MintToParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        mint=instruction.keys[0].pubkey,
-        dest=instruction.keys[1].pubkey,
-        mint_authority=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
+        amount=amount,
+        mint=keys[0].pubkey,
+        dest=keys[1].pubkey,
+        mint_authority=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
     )
 
 
 def decode_burn(instruction: TransactionInstruction) -> BurnParams:
     """Decode a burn token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN)
+    (amount,) = __unpack_and_validate_instruction(instruction, 3, InstructionType.BURN, AMOUNT_INSTRUCTION_LAYOUT)
+    keys = instruction.keys
     return BurnParams(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        account=instruction.keys[0].pubkey,
-        mint=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
+        amount=amount,
+        account=keys[0].pubkey,
+        mint=keys[1].pubkey,
+        owner=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
     )
 
 
 def decode_close_account(instruction: TransactionInstruction) -> CloseAccountParams:
     """Decode a close account token transaction and retrieve the instruction params."""
     _ = __parse_and_validate_instruction(instruction, 3, InstructionType.CLOSE_ACCOUNT)
+    keys = instruction.keys
     return CloseAccountParams(
         program_id=instruction.program_id,
-        account=instruction.keys[0].pubkey,
-        dest=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
+        account=keys[0].pubkey,
+        dest=keys[1].pubkey,
+        owner=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
     )
 
 
 def decode_freeze_account(instruction: TransactionInstruction) -> FreezeAccountParams:
     """Decode a freeze account token transaction and retrieve the instruction params."""
     _ = __parse_and_validate_instruction(instruction, 3, InstructionType.FREEZE_ACCOUNT)
+    keys = instruction.keys
     return FreezeAccountParams(
         program_id=instruction.program_id,
-        account=instruction.keys[0].pubkey,
-        mint=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
+        account=keys[0].pubkey,
+        mint=keys[1].pubkey,
+        owner=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
     )
 
 
 def decode_thaw_account(instruction: TransactionInstruction) -> ThawAccountParams:
     """Decode a thaw account token transaction and retrieve the instruction params."""
     _ = __parse_and_validate_instruction(instruction, 3, InstructionType.THAW_ACCOUNT)
+    keys = instruction.keys
     return ThawAccountParams(
         program_id=instruction.program_id,
-        account=instruction.keys[0].pubkey,
-        mint=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
+        account=keys[0].pubkey,
+        mint=keys[1].pubkey,
+        owner=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
     )
 
 
 def decode_transfer2(instruction: TransactionInstruction) -> Transfer2Params:
     """Decode a transfer2 token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 4, InstructionType.TRANSFER2)
+    amount, decimals = __unpack_and_validate_instruction(
+        instruction, 4, InstructionType.TRANSFER2, AMOUNT2_INSTRUCTION_LAYOUT
+    )
+    keys = instruction.keys
     return Transfer2Params(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        source=instruction.keys[0].pubkey,
-        mint=instruction.keys[1].pubkey,
-        dest=instruction.keys[2].pubkey,
-        owner=instruction.keys[3].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[4:]],
+        amount=amount,
+        decimals=decimals,
+        source=keys[0].pubkey,
+        mint=keys[1].pubkey,
+        dest=keys[2].pubkey,
+        owner=keys[3].pubkey,
+        signers=[signer.pubkey for signer in keys[4:]],
     )
 
 
 def decode_approve2(instruction: TransactionInstruction) -> Approve2Params:
     """Decode a approve2 token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 4, InstructionType.APPROVE2)
+    amount, decimals = __unpack_and_validate_instruction(
+        instruction, 4, InstructionType.APPROVE2, AMOUNT2_INSTRUCTION_LAYOUT
+    )
+    keys = instruction.keys
     return Approve2Params(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        source=instruction.keys[0].pubkey,
-        mint=instruction.keys[1].pubkey,
-        delegate=instruction.keys[2].pubkey,
-        owner=instruction.keys[3].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[4:]],
+        amount=amount,
+        decimals=decimals,
+        source=keys[0].pubkey,
+        mint=keys[1].pubkey,
+        delegate=keys[2].pubkey,
+        owner=keys[3].pubkey,
+        signers=[signer.pubkey for signer in keys[4:]],
     )
 
 
 def decode_mint_to2(instruction: TransactionInstruction) -> MintTo2Params:
     """Decode a mintTo2 token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.MINT_TO2)
+    amount, decimals = __unpack_and_validate_instruction(
+        instruction, 3, InstructionType.MINT_TO2, AMOUNT2_INSTRUCTION_LAYOUT
+    )
+    keys = instruction.keys
     return MintTo2Params(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        mint=instruction.keys[0].pubkey,
-        dest=instruction.keys[1].pubkey,
-        mint_authority=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
+        amount=amount,
+        decimals=decimals,
+        mint=keys[0].pubkey,
+        dest=keys[1].pubkey,
+        mint_authority=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
     )
 
 
 def decode_burn2(instruction: TransactionInstruction) -> Burn2Params:
     """Decode a burn2 token transaction and retrieve the instruction params."""
-    parsed_data = __parse_and_validate_instruction(instruction, 3, InstructionType.BURN2)
+    amount, decimals = __unpack_and_validate_instruction(
+        instruction, 3, InstructionType.BURN2, AMOUNT2_INSTRUCTION_LAYOUT
+    )
+    keys = instruction.keys
     return Burn2Params(
         program_id=instruction.program_id,
-        amount=parsed_data.args.amount,
-        decimals=parsed_data.args.decimals,
-        account=instruction.keys[0].pubkey,
-        mint=instruction.keys[1].pubkey,
-        owner=instruction.keys[2].pubkey,
-        signers=[signer.pubkey for signer in instruction.keys[3:]],
+        amount=amount,
+        decimals=decimals,
+        account=keys[0].pubkey,
+        mint=keys[1].pubkey,
+        owner=keys[2].pubkey,
+        signers=[signer.pubkey for signer in keys[3:]],
     )
 
 
+_DECODERS: Dict[int, Callable[[TransactionInstruction], Any]] = {
+    InstructionType.INITIALIZE_MINT: decode_initialize_mint,
+    InstructionType.INITIALIZE_ACCOUNT: decode_initialize_account,
+    InstructionType.INITIALIZE_MULTISIG: decode_initialize_multisig,
+    InstructionType.TRANSFER: decode_transfer,
+    InstructionType.APPROVE: decode_approve,
+    InstructionType.REVOKE: decode_revoke,
+    InstructionType.SET_AUTHORITY: decode_set_authority,
+    InstructionType.MINT_TO: decode_mint_to,
+    InstructionType.BURN: decode_burn,
+    InstructionType.CLOSE_ACCOUNT: decode_close_account,
+    InstructionType.FREEZE_ACCOUNT: decode_freeze_account,
+    InstructionType.THAW_ACCOUNT: decode_thaw_account,
+    InstructionType.TRANSFER2: decode_transfer2,
+    InstructionType.APPROVE2: decode_approve2,
+    InstructionType.MINT_TO2: decode_mint_to2,
+    InstructionType.BURN2: decode_burn2,
+}
+
+
+def decode_instruction(instruction: TransactionInstruction) -> Any:
+    """Decode any token instruction and retrieve the params of its instruction type.
+
+    The instruction type is read from the first byte of the instruction data.
+
+    >>> dest, owner, source, token = PublicKey(1), PublicKey(2), PublicKey(3), PublicKey(4)
+    >>> params = TransferParams(amount=1000, dest=dest, owner=owner, program_id=token, source=source)
+    >>> decode_instruction(transfer(params)) == params
+    True
+    """
+    decoder = _DECODERS.get(instruction.data[0]) if instruction.data else None
+    if decoder is None:
+        instruction_type = instruction.data[0] if instruction.data else None
+        raise ValueError(f"invalid instruction; unknown instruction type {instruction_type}")
+    return decoder(instruction)
+
+
+def __build_instruction_data(instruction_type: InstructionType, args: Any) -> bytes:
+    return bytes((instruction_type,)) + INSTRUCTION_ARGS_LAYOUTS[instruction_type].build(args)
+
+
 def __add_signers(keys: List[AccountMeta], owner: PublicKey, signers: List[PublicKey]) -> None:
     if signers:
-        keys.append(AccountMeta(pubkey=owner, is_signer=False, is_writable=False))
-        for signer in signers:
-            keys.append(AccountMeta(pubkey=signer, is_signer=True, is_writable=False))
+        keys.append(AccountMeta(owner, False, False))
+        keys.extend([AccountMeta(signer, True, False) for signer in signers])
     else:
-        keys.append(AccountMeta(pubkey=owner, is_signer=True, is_writable=False))
+        keys.append(AccountMeta(owner, True, False))
 
 
 def __burn_instruction(params: Union[BurnParams, Burn2Params], data: Any) -> TransactionInstruction:
     keys = [
-        AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=True),
+        AccountMeta(params.account, False, True),
+        AccountMeta(params.mint, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
@@ -529,10 +657,10 @@ def __burn_instruction(params: Union[BurnParams, Burn2Params], data: Any) -> Tra
 def __freeze_or_thaw_instruction(
     params: Union[FreezeAccountParams, ThawAccountParams], instruction_type: InstructionType
 ) -> TransactionInstruction:
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=instruction_type, args=None))
+    data = _ZERO_ARG_DATA[instruction_type]
     keys = [
-        AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
+        AccountMeta(params.account, False, True),
+        AccountMeta(params.mint, False, False),
     ]
     __add_signers(keys, params.owner, params.signers)
 
@@ -541,8 +669,8 @@ def __freeze_or_thaw_instruction(
 
 def __mint_to_instruction(params: Union[MintToParams, MintTo2Params], data: Any) -> TransactionInstruction:
     keys = [
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.mint, False, True),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.mint_authority, params.signers)
 
@@ -568,22 +696,20 @@ def initialize_mint(params: InitializeMintParams) -> TransactionInstruction:
     >>> type(initialize_mint(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    freeze_authority, opt = (params.freeze_authority, 1) if params.freeze_authority else (PublicKey(0), 0)
-    data = INSTRUCTIONS_LAYOUT.build(
+    freeze_authority, opt = (bytes(params.freeze_authority), 1) if params.freeze_authority else (_ZERO_PUBKEY_BYTES, 0)
+    data = __build_instruction_data(
+        InstructionType.INITIALIZE_MINT,
         dict(
-            instruction_type=InstructionType.INITIALIZE_MINT,
-            args=dict(
-                decimals=params.decimals,
-                mint_authority=bytes(params.mint_authority),
-                freeze_authority_option=opt,
-                freeze_authority=bytes(freeze_authority),
-            ),
-        )
+            decimals=params.decimals,
+            mint_authority=bytes(params.mint_authority),
+            freeze_authority_option=opt,
+            freeze_authority=freeze_authority,
+        ),
     )
     return TransactionInstruction(
         keys=[
-            AccountMeta(pubkey=params.mint, is_signer=False, is_writable=True),
-            AccountMeta(pubkey=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
+            AccountMeta(params.mint, False, True),
+            AccountMeta(SYSVAR_RENT_PUBKEY, False, False),
         ],
         program_id=params.program_id,
         data=data,
@@ -607,13 +733,13 @@ def initialize_account(params: InitializeAccountParams) -> TransactionInstructio
     >>> type(initialize_account(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.INITIALIZE_ACCOUNT, args=None))
+    data = _ZERO_ARG_DATA[InstructionType.INITIALIZE_ACCOUNT]
     return TransactionInstruction(
         keys=[
-            AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-            AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=params.owner, is_signer=False, is_writable=False),
-            AccountMeta(pubkey=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
+            AccountMeta(params.account, False, True),
+            AccountMeta(params.mint, False, False),
+            AccountMeta(params.owner, False, False),
+            AccountMeta(SYSVAR_RENT_PUBKEY, False, False),
         ],
         program_id=params.program_id,
         data=data,
@@ -639,13 +765,13 @@ def initialize_multisig(params: InitializeMultisigParams) -> TransactionInstruct
     >>> type(initialize_multisig(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.INITIALIZE_MULTISIG, args=dict(m=params.m)))
+    data = __build_instruction_data(InstructionType.INITIALIZE_MULTISIG, dict(m=params.m))
     keys = [
-        AccountMeta(pubkey=params.multisig, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=SYSVAR_RENT_PUBKEY, is_signer=False, is_writable=False),
+        AccountMeta(params.multisig, False, True),
+        AccountMeta(SYSVAR_RENT_PUBKEY, False, False),
     ]
     for signer in params.signers:
-        keys.append(AccountMeta(pubkey=signer, is_signer=False, is_writable=False))
+        keys.append(AccountMeta(signer, False, False))
 
     return TransactionInstruction(keys=keys, program_id=params.program_id, data=data)
 
@@ -666,10 +792,10 @@ def transfer(params: TransferParams) -> TransactionInstruction:
     >>> type(transfer(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.TRANSFER, args=dict(amount=params.amount)))
+    data = AMOUNT_INSTRUCTION_LAYOUT.pack(_TRANSFER_TAG, params.amount)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
@@ -690,10 +816,10 @@ def approve(params: ApproveParams) -> TransactionInstruction:
     >>> type(approve(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.APPROVE, args=dict(amount=params.amount)))
+    data = AMOUNT_INSTRUCTION_LAYOUT.pack(_APPROVE_TAG, params.amount)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.delegate, is_signer=False, is_writable=False),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.delegate, False, False),
     ]
     __add_signers(keys, params.owner, params.signers)
 
@@ -710,8 +836,8 @@ def revoke(params: RevokeParams) -> TransactionInstruction:
     >>> type(revoke(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.REVOKE, args=None))
-    keys = [AccountMeta(pubkey=params.delegate, is_signer=False, is_writable=False)]
+    data = _ZERO_ARG_DATA[InstructionType.REVOKE]
+    keys = [AccountMeta(params.delegate, False, False)]
     __add_signers(keys, params.owner, params.signers)
 
     return TransactionInstruction(keys=keys, program_id=params.program_id, data=data)
@@ -733,14 +859,12 @@ def set_authority(params: SetAuthorityParams) -> TransactionInstruction:
     >>> type(set_authority(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    new_authority, opt = (params.new_authority, 1) if params.new_authority else (PublicKey(0), 0)
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(
-            instruction_type=InstructionType.SET_AUTHORITY,
-            args=dict(authority_type=params.authority, new_authority_option=opt, new_authority=bytes(new_authority)),
-        )
+    new_authority, opt = (bytes(params.new_authority), 1) if params.new_authority else (_ZERO_PUBKEY_BYTES, 0)
+    data = __build_instruction_data(
+        InstructionType.SET_AUTHORITY,
+        dict(authority_type=params.authority, new_authority_option=opt, new_authority=new_authority),
     )
-    keys = [AccountMeta(pubkey=params.account, is_signer=False, is_writable=True)]
+    keys = [AccountMeta(params.account, False, True)]
     __add_signers(keys, params.current_authority, params.signers)
 
     return TransactionInstruction(keys=keys, program_id=params.program_id, data=data)
@@ -762,7 +886,7 @@ def mint_to(params: MintToParams) -> TransactionInstruction:
     >>> type(mint_to(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.MINT_TO, args=dict(amount=params.amount)))
+    data = AMOUNT_INSTRUCTION_LAYOUT.pack(_MINT_TO_TAG, params.amount)
     return __mint_to_instruction(params, data)
 
 
@@ -776,7 +900,7 @@ def burn(params: BurnParams) -> TransactionInstruction:
     >>> type(burn(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.BURN, args=dict(amount=params.amount)))
+    data = AMOUNT_INSTRUCTION_LAYOUT.pack(_BURN_TAG, params.amount)
     return __burn_instruction(params, data)
 
 
@@ -791,10 +915,10 @@ def close_account(params: CloseAccountParams) -> TransactionInstruction:
     >>> type(close_account(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(dict(instruction_type=InstructionType.CLOSE_ACCOUNT, args=None))
+    data = _ZERO_ARG_DATA[InstructionType.CLOSE_ACCOUNT]
     keys = [
-        AccountMeta(pubkey=params.account, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.account, False, True),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
@@ -841,13 +965,11 @@ def transfer2(params: Transfer2Params) -> TransactionInstruction:
     >>> type(transfer2(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.TRANSFER2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = AMOUNT2_INSTRUCTION_LAYOUT.pack(_TRANSFER2_TAG, params.amount, params.decimals)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=params.dest, is_signer=False, is_writable=True),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.mint, False, False),
+        AccountMeta(params.dest, False, True),
     ]
     __add_signers(keys, params.owner, params.signers)
 
@@ -870,13 +992,11 @@ def approve2(params: Approve2Params) -> TransactionInstruction:
     >>> type(approve2(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.APPROVE2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = AMOUNT2_INSTRUCTION_LAYOUT.pack(_APPROVE2_TAG, params.amount, params.decimals)
     keys = [
-        AccountMeta(pubkey=params.source, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=params.mint, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=params.delegate, is_signer=False, is_writable=False),
+        AccountMeta(params.source, False, True),
+        AccountMeta(params.mint, False, False),
+        AccountMeta(params.delegate, False, False),
     ]
     __add_signers(keys, params.owner, params.signers)
 
@@ -898,9 +1018,7 @@ def mint_to2(params: MintTo2Params) -> TransactionInstruction:
     >>> type(mint_to2(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.MINT_TO2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = AMOUNT2_INSTRUCTION_LAYOUT.pack(_MINT_TO2_TAG, params.amount, params.decimals)
     return __mint_to_instruction(params, data)
 
 
@@ -914,7 +1032,5 @@ def burn2(params: Burn2Params) -> TransactionInstruction:
     >>> type(burn2(params))
     <class 'solana.transaction.TransactionInstruction'>
     """
-    data = INSTRUCTIONS_LAYOUT.build(
-        dict(instruction_type=InstructionType.BURN2, args=dict(amount=params.amount, decimals=params.decimals))
-    )
+    data = AMOUNT2_INSTRUCTION_LAYOUT.pack(_BURN2_TAG, params.amount, params.decimals)
     return __burn_instruction(params, data)
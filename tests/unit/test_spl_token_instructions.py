@@ -1,5 +1,7 @@
 """Unit tests for SPL-token instructions."""
 
+import pytest
+
 import spl.token.instructions as spl_token
 from solana.publickey import PublicKey
 from spl.token.constants import TOKEN_PROGRAM_ID
@@ -56,6 +58,24 @@ def test_initialize_multisig():
     instruction = spl_token.initialize_multisig(params)
     assert spl_token.decode_initialize_multisig(instruction) == params
 
+    no_signer_params = spl_token.InitializeMultisigParams(
+        program_id=TOKEN_PROGRAM_ID,
+        multisig=new_multisig,
+        signers=[],
+        m=0,
+    )
+    instruction = spl_token.initialize_multisig(no_signer_params)
+    assert spl_token.decode_initialize_multisig(instruction) == no_signer_params
+
+    m_of_n_params = spl_token.InitializeMultisigParams(
+        program_id=TOKEN_PROGRAM_ID,
+        multisig=new_multisig,
+        signers=signers,
+        m=2,
+    )
+    instruction = spl_token.initialize_multisig(m_of_n_params)
+    assert spl_token.decode_initialize_multisig(instruction) == m_of_n_params
+
 
 def test_transfer(stubbed_reciever, stubbed_sender):
     """Test transfer."""
@@ -67,6 +87,7 @@ def test_transfer(stubbed_reciever, stubbed_sender):
         amount=123,
     )
     instruction = spl_token.transfer(params)
+    assert instruction.data == bytes.fromhex("037b00000000000000")
     assert spl_token.decode_transfer(instruction) == params
 
     multisig_params = spl_token.TransferParams(
@@ -81,6 +102,22 @@ def test_transfer(stubbed_reciever, stubbed_sender):
     assert spl_token.decode_transfer(instruction) == multisig_params
 
 
+def test_params_default_signers_not_shared(stubbed_reciever, stubbed_sender):
+    """Test that params built without signers each get their own signers list."""
+    first, second = (
+        spl_token.TransferParams(
+            program_id=TOKEN_PROGRAM_ID,
+            source=stubbed_sender.public_key(),
+            dest=stubbed_reciever,
+            owner=stubbed_sender.public_key(),
+            amount=123,
+        )
+        for _ in range(2)
+    )
+    assert first.signers == [] and second.signers == []
+    assert first.signers is not second.signers
+
+
 def test_approve(stubbed_sender):
     """Test approve."""
     delegate_account = PublicKey(0)
@@ -152,6 +189,10 @@ def test_set_authority():
     assert not decoded_params.new_authority
     assert decoded_params == multisig_params
 
+    invalid_authority_data = instruction.data[:1] + bytes([9]) + instruction.data[2:]
+    with pytest.raises(ValueError):
+        spl_token.decode_set_authority(instruction._replace(data=invalid_authority_data))
+
 
 def test_mint_to(stubbed_reciever):
     """Test mint to."""
@@ -285,6 +326,7 @@ def test_transfer2(stubbed_reciever, stubbed_sender):
         decimals=6,
     )
     instruction = spl_token.transfer2(params)
+    assert instruction.data == bytes.fromhex("0c7b0000000000000006")
     assert spl_token.decode_transfer2(instruction) == params
 
     multisig_params = spl_token.Transfer2Params(
@@ -382,3 +424,46 @@ def test_burn2(stubbed_reciever):
     )
     instruction = spl_token.burn2(multisig_params)
     assert spl_token.decode_burn2(instruction) == multisig_params
+
+
+def test_decode_instruction(stubbed_reciever, stubbed_sender):
+    """Test decoding instructions by their instruction type."""
+    transfer_params = spl_token.TransferParams(
+        program_id=TOKEN_PROGRAM_ID,
+        source=stubbed_sender.public_key(),
+        dest=stubbed_reciever,
+        owner=stubbed_sender.public_key(),
+        amount=123,
+    )
+    assert spl_token.decode_instruction(spl_token.transfer(transfer_params)) == transfer_params
+
+    revoke_params = spl_token.RevokeParams(
+        program_id=TOKEN_PROGRAM_ID, delegate=stubbed_reciever, owner=stubbed_sender.public_key()
+    )
+    assert spl_token.decode_instruction(spl_token.revoke(revoke_params)) == revoke_params
+
+    initialize_mint_params = spl_token.InitializeMintParams(
+        decimals=6,
+        program_id=TOKEN_PROGRAM_ID,
+        mint=stubbed_reciever,
+        mint_authority=stubbed_sender.public_key(),
+        freeze_authority=PublicKey(1),
+    )
+    instruction = spl_token.initialize_mint(initialize_mint_params)
+    assert spl_token.decode_instruction(instruction) == initialize_mint_params
+
+    set_authority_params = spl_token.SetAuthorityParams(
+        program_id=TOKEN_PROGRAM_ID,
+        account=stubbed_reciever,
+        authority=spl_token.AuthorityType.MINT_TOKENS,
+        current_authority=stubbed_sender.public_key(),
+        new_authority=PublicKey(1),
+    )
+    instruction = spl_token.set_authority(set_authority_params)
+    assert spl_token.decode_instruction(instruction) == set_authority_params
+
+    instruction = spl_token.revoke(revoke_params)
+    with pytest.raises(ValueError):
+        spl_token.decode_instruction(instruction._replace(data=bytes([255])))
+    with pytest.raises(ValueError):
+        spl_token.decode_instruction(instruction._replace(data=b""))